@@ -1,5 +1,7 @@
 import json
 
+from .keyword_matcher import get_keyword_matcher
+
 class AegisEthicsFilter:
     """
     照合結果に対する語りの公開可否を判断し、必要に応じて遮断するクラス。
@@ -37,10 +39,9 @@ class AegisEthicsFilter:
             return intervention_narrative, True
 
         # 2. 禁止キーワードのチェック
-        for keyword in self.forbidden_keywords:
-            if keyword in narrative:
-                intervention_narrative = "Aegis intervention: Narrative contains a forbidden keyword."
-                return intervention_narrative, True
+        if get_keyword_matcher(self.forbidden_keywords).find_all(narrative):
+            intervention_narrative = "Aegis intervention: Narrative contains a forbidden keyword."
+            return intervention_narrative, True
 
         # 制限に該当しない場合は、元の語りをそのまま返す
         return narrative, False
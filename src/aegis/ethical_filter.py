@@ -1,5 +1,7 @@
 # ethical_filter.py - 大賢者オリエンの誓い
 
+from .keyword_matcher import get_keyword_matcher
+
 class EthicalFilter:
     """
     語りが他者に害を及ぼす可能性（NG語彙、攻撃性、差別性など）を検出し、
@@ -25,14 +27,16 @@ class EthicalFilter:
         
         modified_narratives = narratives.copy()
         found_words = []
+        # NGワードリストが変わった時だけオートマトンを再構築する
+        matcher = get_keyword_matcher(self.ng_words)
 
         for key, text in narratives.items():
-            for word in self.ng_words:
-                if word in text:
-                    is_safe = False
-                    found_words.append(word)
-                    # NGワードを伏字に置換
-                    modified_narratives[key] = modified_narratives[key].replace(word, '■' * len(word))
+            # NGワードを伏字に置換
+            redacted_text, words_in_text = matcher.redact(text)
+            if words_in_text:
+                is_safe = False
+                found_words.extend(words_in_text)
+                modified_narratives[key] = redacted_text
 
         if not is_safe:
             # 重複を除いてログメッセージを作成
@@ -0,0 +1,174 @@
+# keyword_matcher.py - イージスとオリエンの共有する語彙の網
+
+import functools
+import unicodedata
+from collections import deque
+from typing import Iterable, List, Optional, Tuple
+
+# 半角カナの濁点・半濁点。直前の文字と一緒に正規化しないと「ｶﾞ」が「ガ」にならない。
+_HALFWIDTH_SOUND_MARKS = {'ﾞ', 'ﾟ'}
+
+
+def _is_attached_mark(char: str) -> bool:
+    """直前の文字に結合して正規化されるべき文字かどうか。"""
+    return char in _HALFWIDTH_SOUND_MARKS or unicodedata.combining(char) != 0
+
+
+def normalize_with_offsets(text: str) -> Tuple[str, List[Tuple[int, int]]]:
+    """
+    テキストをNFKC正規化・casefoldし、正規化後の各文字が元テキストの
+    どの範囲に由来するかの対応表と共に返す。
+
+    全角英数字・半角カナ・大文字小文字の揺れを吸収しつつ、
+    一致箇所を元テキスト上のスパンとして報告するために使う。
+
+    Returns:
+        tuple: (正規化済みテキスト, [(元の開始位置, 元の終了位置), ...])
+    """
+    normalized_chars: List[str] = []
+    offsets: List[Tuple[int, int]] = []
+    i = 0
+    length = len(text)
+    while i < length:
+        # 基底文字と、それに続く結合文字をひとまとまりとして正規化する
+        j = i + 1
+        while j < length and _is_attached_mark(text[j]):
+            j += 1
+        chunk = unicodedata.normalize('NFKC', text[i:j]).casefold()
+        for char in chunk:
+            normalized_chars.append(char)
+            offsets.append((i, j))
+        i = j
+    return ''.join(normalized_chars), offsets
+
+
+def normalize_text(text: str) -> str:
+    """照合用にテキストを正規化する（対応表が不要な場合）。"""
+    return normalize_with_offsets(text)[0]
+
+
+class KeywordMatcher:
+    """
+    複数のキーワードを一度にコンパイルし、テキストを1回の線形走査で照合する
+    Aho-Corasick型のオートマトン。
+
+    キーワードごとに部分文字列検索を繰り返す O(語数 × 文長) の照合を、
+    O(文長 + 一致数) に置き換える。
+    """
+    def __init__(self, keywords: Iterable[str]):
+        # 入力順を保持する（どのキーワードを優先して報告するかの判断に使う）
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        # 各状態で出力されるキーワード (キーワード番号, 正規化後の長さ)
+        self._output: List[List[Tuple[int, int]]] = [[]]
+        self._build()
+
+    def _build(self):
+        for index, keyword in enumerate(self.keywords):
+            pattern = normalize_text(keyword)
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].append((index, len(pattern)))
+
+        # 幅優先で失敗遷移を構築し、出力を失敗先から継承する
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        テキスト中のすべての一致を返す。重なり合う一致もそれぞれ報告する。
+
+        Args:
+            text (str): 検査対象のテキスト。
+
+        Returns:
+            list: 元テキスト上の (開始位置, 終了位置, キーワード) のリスト。開始位置順。
+        """
+        if not text or len(self._goto) == 1:
+            return []
+        normalized, offsets = normalize_with_offsets(text)
+        matches = []
+        state = 0
+        for position, char in enumerate(normalized):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index, pattern_length in self._output[state]:
+                start = offsets[position - pattern_length + 1][0]
+                end = offsets[position][1]
+                matches.append((start, end, self.keywords[index]))
+        matches.sort(key=lambda match: (match[0], match[1]))
+        return matches
+
+    def find_first_keyword(self, text: str) -> Optional[str]:
+        """
+        テキストに含まれるキーワードのうち、キーワードリスト上で最も先に
+        定義されたものを返す。含まれなければNone。
+        """
+        found = {keyword for _, _, keyword in self.find_all(text)}
+        for keyword in self.keywords:
+            if keyword in found:
+                return keyword
+        return None
+
+    def redact(self, text: str, mask_char: str = '■') -> Tuple[str, List[str]]:
+        """
+        一致箇所を伏字に置換する。重なり合う一致は一つの範囲にまとめる。
+
+        Returns:
+            tuple: (伏字化されたテキスト, 検出されたキーワードのリスト)
+        """
+        matches = self.find_all(text)
+        if not matches:
+            return text, []
+        merged: List[List[int]] = []
+        for start, end, _ in matches:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        pieces = []
+        cursor = 0
+        for start, end in merged:
+            pieces.append(text[cursor:start])
+            pieces.append(mask_char * (end - start))
+            cursor = end
+        pieces.append(text[cursor:])
+        found_words = []
+        for _, _, keyword in matches:
+            if keyword not in found_words:
+                found_words.append(keyword)
+        return ''.join(pieces), found_words
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_keyword_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """
+    キーワードリストに対応するコンパイル済みマッチャーを返す。
+    同じリストに対しては再構築せず、リストが変わった時だけ新しく構築する。
+    """
+    return _compile(tuple(keywords))
@@ -1,5 +1,7 @@
 from typing import Optional
 
+from .keyword_matcher import get_keyword_matcher
+
 # publication_gatekeeper.py - イージスの誓い
 
 class PublicationGatekeeper:
@@ -41,11 +43,9 @@ class PublicationGatekeeper:
         }
         
         found_keyword = None
+        matcher = get_keyword_matcher(confidential_keywords)
         for key, text in narratives.items():
-            for word in confidential_keywords:
-                if word in text:
-                    found_keyword = word
-                    break
+            found_keyword = matcher.find_first_keyword(text)
             if found_keyword:
                 break
 
@@ -4,6 +4,8 @@ import json
 import google.generativeai as genai
 import google.api_core.exceptions
 from src.vetra.vetra_llm_core import VetraLLMCore
+from src.vetra.llm_response_cache import response_cache_from_config
+from src.vetra.stub_llm_backend import StubLLMBackend
 
 class GeminiClient:
     """
@@ -15,26 +17,39 @@ class GeminiClient:
         """
         設定ファイルを読み込み、APIキーを環境変数から取得してクライアントを初期化する。
         フォールバック用のローカルLLMも準備する。
+        設定の"backend"または環境変数 SIGMASENSE_LLM_BACKEND が "stub" の場合は、
+        APIキーなしでオフラインのスタブを使う。
         """
-        # APIキーの設定
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("環境変数 'GEMINI_API_KEY' が設定されていません。")
-        genai.configure(api_key=api_key)
-
         # 設定ファイルの読み込み
         self.gemini_model_name = 'gemini-2.5-flash' # デフォルト値
         self.fallback_model_name = None
+        config = {}
         if os.path.exists(config_path):
             with open(config_path, 'r') as f:
                 config = json.load(f)
                 self.gemini_model_name = config.get('gemini_model', self.gemini_model_name)
                 self.fallback_model_name = config.get('fallback_local_model')
+        self.backend = config.get('backend') or os.getenv("SIGMASENSE_LLM_BACKEND", "gemini")
+
+        # 同一プロンプトの応答を再利用するためのキャッシュ（設定で有効化されている場合のみ）
+        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+        self.response_cache = response_cache_from_config(config, project_root)
 
-        # Geminiモデルの初期化
-        self.text_model = genai.GenerativeModel(self.gemini_model_name)
-        self.vision_model = genai.GenerativeModel(self.gemini_model_name)
-        print(f"✅ GeminiClientが初期化され、プライマリモデル '{self.gemini_model_name}' の準備ができました。")
+        if self.backend == "stub":
+            self.text_model = StubLLMBackend()
+            self.vision_model = self.text_model
+            print(f"✅ GeminiClientがスタブバックエンドで初期化されました（モデル名: '{self.gemini_model_name}'）。")
+        else:
+            # APIキーの設定
+            api_key = os.getenv("GEMINI_API_KEY")
+            if not api_key:
+                raise ValueError("環境変数 'GEMINI_API_KEY' が設定されていません。")
+            genai.configure(api_key=api_key)
+
+            # Geminiモデルの初期化
+            self.text_model = genai.GenerativeModel(self.gemini_model_name)
+            self.vision_model = genai.GenerativeModel(self.gemini_model_name)
+            print(f"✅ GeminiClientが初期化され、プライマリモデル '{self.gemini_model_name}' の準備ができました。")
 
         # フォールバック用ローカルLLMの初期化
         self.fallback_llm = None
@@ -82,16 +97,32 @@ class GeminiClient:
             print(f"⚠️  JSONパースに失敗しました。クリーンなテキストを返します。応答テキスト: {json_text}")
             return json_text # パース失敗時はクリーンなテキストを返す
 
+    def _generate_text(self, prompt):
+        """
+        プライマリAPIでテキストを生成する。
+        Returns a tuple (response_text, error)。
+        """
+        try:
+            response = self.text_model.generate_content(prompt)
+            return response.text, None
+        except (google.api_core.exceptions.GoogleAPICallError, Exception) as e:
+            return None, e
+
     def query_text(self, prompt, system_prompt="You are a helpful assistant."):
         """
         テキストプロンプトをAPIに送信し、レスポンスを返す。
         API呼び出しに失敗した場合、ローカルLLMにフォールバックする。
         """
         print("   - (Text) プライマリAPIにクエリを送信中...")
-        try:
-            response = self.text_model.generate_content(prompt)
-            return self._parse_response(response.text)
-        except (google.api_core.exceptions.GoogleAPICallError, Exception) as e:
+        if self.response_cache is not None:
+            key = self.response_cache.make_key(self.backend, self.gemini_model_name, prompt)
+            response_text, e = self.response_cache.get_or_compute(key, lambda: self._generate_text(prompt))
+        else:
+            response_text, e = self._generate_text(prompt)
+
+        if e is None:
+            return self._parse_response(response_text)
+        else:
             print(f"❗ プライマリAPIクエリ中にエラーが発生しました: {e}")
             
             if self.fallback_llm:
@@ -6,6 +6,7 @@ from sigma_image_engines.engine_opencv_legacy import LegacyOpenCVEngine
 from sigma_image_engines.engine_mobilenet import MobileNetV1Engine
 from sigma_image_engines.engine_mobilevit import MobileViTEngine
 from vetra.vetra_llm_core import VetraLLMCore
+from vetra.llm_response_cache import load_response_cache
 
 class DimensionGenerator:
     """
@@ -28,8 +29,10 @@ class DimensionGenerator:
         print(f"{len(self.engines)} engines loaded.")
 
         # Initialize VetraLLMCore and the path for discovered dimensions
-        self.vetra = VetraLLMCore()
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        # Repeated proposals for the same unknown pattern are served from the response cache
+        vetra_profile_path = os.path.join(project_root, '..', 'config', 'vetra_llm_core_profile.json')
+        self.vetra = VetraLLMCore(response_cache=load_response_cache(vetra_profile_path))
         self.discovered_dims_path = os.path.join(project_root, 'config', 'vector_dimensions_discovered.yaml')
 
     def generate_dimensions(self, image_path_or_obj):
@@ -0,0 +1,172 @@
+# ethics_pipeline.py - 八人の誓いの実行計画
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+GATE = "gate"
+TRANSFORM = "transform"
+OBSERVER = "observer"
+
+DEFAULT_MODES = {
+    # 本番向け：重大な違反で即座に打ち切り、独立した検査は並列に実行する
+    "fast": {"early_exit": True, "parallel": True, "max_workers": 4},
+    # 監査向け：違反があってもすべての誓いを順に実行し、完全なログを残す
+    "exhaustive": {"early_exit": False, "parallel": False, "max_workers": 1},
+}
+
+
+class EthicsCheck:
+    """
+    倫理パイプラインを構成する一つの誓いの宣言。
+
+    kind:
+        "gate"      語りを遮断しうる検査。失敗は重大な違反として扱う。
+        "transform" 語りを書き換える調整。後続の検査はこの結果に依存する。
+        "observer"  語りを読むだけの検査。互いに独立しているため並列に実行できる。
+    """
+    def __init__(self, name: str, run: Callable, kind: str = OBSERVER, cost: float = 1.0):
+        if kind not in (GATE, TRANSFORM, OBSERVER):
+            raise ValueError(f"Unsupported ethics check kind: {kind}")
+        self.name = name
+        self.run = run
+        self.kind = kind
+        self.cost = cost
+
+
+class MemorySnapshot:
+    """
+    倫理チェック1回分の記憶の読み取りを共有するためのビュー。
+    複数の誓いが同じ記憶を参照しても、全件の読み出しは一度だけ行われる。
+    """
+    def __init__(self, memory_graph):
+        self._memory_graph = memory_graph
+        self._memories = None
+        self._lock = threading.Lock()
+
+    def get_all_memories(self):
+        with self._lock:
+            if self._memories is None:
+                self._memories = self._memory_graph.get_all_memories()
+            return self._memories
+
+
+class EthicsPipeline:
+    """
+    宣言された誓いを、依存関係とコストのヒントに基づいて実行する。
+
+    gateとtransformは宣言順に直列実行され、後続の検査に対する依存の境界となる。
+    境界に挟まれた連続するobserverは互いに独立したグループとして扱われ、
+    安いものから順に（並列モードではスレッドプールで同時に）実行される。
+    連続するgateも、安いものから順に評価される。
+    ログは実行順にかかわらず宣言順に並べて返す。
+    """
+    def __init__(self, checks: list, config: Optional[dict] = None):
+        self.checks = list(checks)
+        self.config = config if config is not None else {}
+        self.modes = dict(DEFAULT_MODES)
+        self.modes.update(self.config.get("modes", {}))
+        self.default_mode = self.config.get("mode", "fast")
+        cost_hints = self.config.get("cost_hints", {})
+        for check in self.checks:
+            if check.name in cost_hints:
+                check.cost = cost_hints[check.name]
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = 0
+
+    def _plan(self) -> list:
+        """
+        宣言された誓いを実行ステージに分割する。
+
+        Returns:
+            list: (kind, [EthicsCheck, ...]) のリスト。
+        """
+        stages: list = []
+        for check in self.checks:
+            if check.kind != TRANSFORM and stages and stages[-1][0] == check.kind:
+                stages[-1][1].append(check)
+            else:
+                stages.append((check.kind, [check]))
+        # 同じステージ内では安い検査から順に実行する（ソートは安定）
+        return [(kind, sorted(group, key=lambda c: c.cost)) for kind, group in stages]
+
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        if self._executor is None or self._executor_workers != max_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ethics")
+            self._executor_workers = max_workers
+        return self._executor
+
+    @staticmethod
+    def _timed(check: EthicsCheck, narratives: dict, experience: dict, context: dict):
+        start = time.perf_counter()
+        result = check.run(narratives, experience, context)
+        return result, time.perf_counter() - start
+
+    def run(self, narratives: dict, experience: dict, context: Optional[dict] = None, mode: Optional[str] = None) -> dict:
+        """
+        倫理チェックを実行する。
+
+        Args:
+            narratives (dict): "intent_narrative"と"growth_narrative"を含む辞書。
+            experience (dict): 今回の経験データ。
+            context (dict, optional): 各誓いが共有する補助データ（記憶のスナップショットなど）。
+            mode (str, optional): "fast"または"exhaustive"。省略時は設定のmodeを使う。
+
+        Returns:
+            dict: passed, log, narratives, timings（誓いごとの秒数）, mode を含む結果。
+        """
+        mode = mode or self.default_mode
+        if mode not in self.modes:
+            raise ValueError(f"Unsupported ethics pipeline mode: {mode}")
+        settings = self.modes[mode]
+        early_exit = settings.get("early_exit", True)
+        parallel = settings.get("parallel", False)
+        max_workers = max(1, int(settings.get("max_workers", 1)))
+        context = context if context is not None else {}
+
+        order = {check.name: i for i, check in enumerate(self.checks)}
+        logs: dict = {}
+        timings: dict = {}
+        passed = True
+
+        def finish():
+            return {
+                "passed": passed,
+                "log": [logs[name] for name in sorted(logs, key=order.get)],
+                "narratives": narratives,
+                "timings": timings,
+                "mode": mode,
+            }
+
+        for kind, group in self._plan():
+            if kind == OBSERVER and parallel and len(group) > 1 and max_workers > 1:
+                executor = self._get_executor(max_workers)
+                futures = [(check, executor.submit(self._timed, check, narratives, experience, context)) for check in group]
+                for check, future in futures:
+                    result, elapsed = future.result()
+                    logs[check.name] = result["log"]
+                    timings[check.name] = elapsed
+                continue
+
+            for check in group:
+                result, elapsed = self._timed(check, narratives, experience, context)
+                logs[check.name] = result["log"]
+                timings[check.name] = elapsed
+                if kind == OBSERVER:
+                    continue
+                narratives = result["narratives"]
+                if kind == GATE and not result["passed"]:
+                    passed = False
+                    if early_exit:
+                        return finish()
+
+        return finish()
+
+    def close(self):
+        """スレッドプールを解放する。"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -7,6 +7,7 @@ from .match_predictor import FastMatchPredictor as MatchPredictor
 from nova.narrative_hint_generator import NarrativeHintGenerator
 from leila.psyche_modulator import PsycheModulator
 from vetra.vetra_llm_core import VetraLLMCore
+from vetra.llm_response_cache import load_response_cache
 
 class SigmaLocalCore:
     """
@@ -36,7 +37,7 @@ class SigmaLocalCore:
         self.predictor = MatchPredictor()
         self.hint_generator = NarrativeHintGenerator()
         self.modulator = PsycheModulator()
-        self.narrator = VetraLLMCore(vetra_config_path) # Pass the correct Vetra config path
+        self.narrator = VetraLLMCore(vetra_config_path, response_cache=load_response_cache(vetra_config_path)) # Pass the correct Vetra config path
         print("SigmaLocalCore is ready for offline analysis.")
 
     def _cosine_similarity(self, vec1, vec2):
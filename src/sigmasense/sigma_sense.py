@@ -33,6 +33,7 @@ from leila.emotion_balancer import EmotionBalancer
 from aegis.publication_gatekeeper import PublicationGatekeeper
 from saphiel.meaning_axis_designer import MeaningAxisDesigner
 from dog_of_sigmasense.instinct_monitor import InstinctMonitor
+from .ethics_pipeline import EthicsPipeline, EthicsCheck, MemorySnapshot, GATE, TRANSFORM, OBSERVER
 
 
 def weighted_cosine_similarity(vec_a, vec_b, weights):
@@ -102,64 +103,57 @@ class SigmaSense:
         self.publication_gatekeeper = PublicationGatekeeper(config=self.all_agent_configs.get_config("saphiel_mission_profile"))
         self.meaning_axis_designer = MeaningAxisDesigner(config=self.all_agent_configs.get_config("saphiel_mission_profile"))
         self.instinct_monitor = InstinctMonitor()
+        self.ethics_pipeline = EthicsPipeline(
+            self._build_ethics_checks(),
+            config=self.all_agent_configs.get_config("ethics_pipeline_profile")
+        )
 
         print("SigmaSense 16th Gen: All components initialized.")
 
-    def run_ethics_check(self, narratives: dict, experience: dict) -> dict:
+    def _build_ethics_checks(self) -> list:
+        """
+        八人の誓いをパイプラインの宣言として組み立てる。
+        宣言順が依存関係の順序であり、ログもこの順に並ぶ。
+        """
+        return [
+            # 1. オリエンの誓い：語りの安全性
+            EthicsCheck("orien", lambda n, e, c: self.ethical_filter.check(n), kind=GATE, cost=1),
+            # 2. イージスの誓い：公開可否の判断
+            EthicsCheck("aegis", lambda n, e, c: self.publication_gatekeeper.check(n), kind=GATE, cost=1),
+            # 3. ヴェトラ先生の誓い：文脈的共感
+            EthicsCheck("vetra", lambda n, e, c: self.contextual_compassion.adjust(n, e), kind=TRANSFORM, cost=1),
+            # 4. レイラの誓い：感情の温度
+            EthicsCheck(
+                "leila",
+                lambda n, e, c: self.emotion_balancer.adjust(n, e.get("auxiliary_analysis", {}).get("psyche_state", {})),
+                kind=TRANSFORM, cost=1
+            ),
+            # 5. サフィールの誓い：意味のバランス（GiNZA解析）
+            EthicsCheck("saphiel", lambda n, e, c: self.meaning_axis_designer.check(n, self.world_model), kind=OBSERVER, cost=10),
+            # 6. 犬のシグマセンスの誓い：直感的監視（記憶の走査）
+            EthicsCheck("dog", lambda n, e, c: self.instinct_monitor.monitor(n, c["memory_graph"]), kind=OBSERVER, cost=5),
+            # 7. ノヴァの誓い：成長の追跡（記憶の走査とGiNZA解析）
+            EthicsCheck("nova", lambda n, e, c: self.growth_tracker.track(n, c["memory_graph"]), kind=OBSERVER, cost=10),
+            # 8. セリアの誓い：語りの完全性
+            EthicsCheck("selia", lambda n, e, c: self.narrative_integrity.track(n, e), kind=TRANSFORM, cost=1),
+        ]
+
+    def run_ethics_check(self, narratives: dict, experience: dict, mode=None) -> dict:
         """
         八人の誓いに基づき、生成された語りの倫理チェックを実行する。
+
+        Args:
+            narratives (dict): "intent_narrative"と"growth_narrative"を含む辞書。
+            experience (dict): 今回の経験データ。
+            mode (str, optional): "fast"（早期打ち切り・並列実行）または"exhaustive"（監査用の全件実行）。
+                省略時はethics_pipeline_profileの設定に従う。
         """
         print("--- Running Ethics Check (The Oath of the Eight) ---")
-        ethics_log = []
-        
-        # 各誓いのモジュールを順に実行
-        # 1. オリエンの誓い：語りの安全性
-        result = self.ethical_filter.check(narratives)
-        ethics_log.append(result["log"])
-        if not result["passed"]:
-            return {"passed": False, "log": ethics_log, "narratives": result["narratives"]}
-        narratives = result["narratives"]
-
-        # 2. イージスの誓い：公開可否の判断
-        result = self.publication_gatekeeper.check(narratives)
-        ethics_log.append(result["log"])
-        if not result["passed"]:
-            return {"passed": False, "log": ethics_log, "narratives": result["narratives"]}
-        narratives = result["narratives"]
-
-        # 3. ヴェトラ先生の誓い：文脈的共感
-        result = self.contextual_compassion.adjust(narratives, experience)
-        ethics_log.append(result["log"])
-        narratives = result["narratives"]
-
-        # 4. レイラの誓い：感情の温度
-        psyche_state = experience.get("auxiliary_analysis", {}).get("psyche_state", {})
-        result = self.emotion_balancer.adjust(narratives, psyche_state)
-        ethics_log.append(result["log"])
-        narratives = result["narratives"]
-
-        # 5. サフィールの誓い：意味のバランス
-        result = self.meaning_axis_designer.check(narratives, self.world_model)
-        ethics_log.append(result["log"])
-        narratives = result["narratives"]
-
-        # 6. 犬のシグマセンスの誓い：直感的監視
-        result = self.instinct_monitor.monitor(narratives, self.memory_graph)
-        ethics_log.append(result["log"])
-        narratives = result["narratives"]
-
-        # 7. ノヴァの誓い：成長の追跡
-        result = self.growth_tracker.track(narratives, self.memory_graph)
-        ethics_log.append(result["log"])
-        narratives = result["narratives"]
-
-        # 8. セリアの誓い：語りの完全性
-        result = self.narrative_integrity.track(narratives, experience)
-        ethics_log.append(result["log"])
-        narratives = result["narratives"]
-        
-        print("--- Ethics Check Completed ---")
-        return {"passed": True, "log": ethics_log, "narratives": narratives}
+        context = {"memory_graph": MemorySnapshot(self.memory_graph)}
+        result = self.ethics_pipeline.run(narratives, experience, context=context, mode=mode)
+        if result["passed"]:
+            print("--- Ethics Check Completed ---")
+        return result
 
     def process_experience(self, image_path_or_obj):
         """
@@ -299,7 +293,8 @@ class SigmaSense:
             "growth_narrative": final_narratives["growth_narrative"],
             "discovered_temporal_patterns": temporal_patterns,
             "ethics_log": ethics_result["log"],
-            "ethics_passed": ethics_result["passed"]
+            "ethics_passed": ethics_result["passed"],
+            "ethics_timings": ethics_result["timings"]
         })
         return final_result
 
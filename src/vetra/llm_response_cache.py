@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+
+class LLMResponseCache:
+    """
+    プロンプトのハッシュをキーとして、LLMの応答を永続化するキャッシュ。
+
+    - 応答はSQLiteに保存され、プロセスをまたいで再利用される。
+    - ttl_secondsを過ぎた応答は期限切れとして扱われ、再生成される。
+    - 同じキーの生成が実行中であれば、後続の呼び出しはその結果を待って共有する（リクエストの合流）。
+    - 生成に失敗した応答（errorがNoneでないもの）は保存しない。
+    """
+
+    def __init__(self, db_path: str, ttl_seconds=None, clock=time.time):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        dir_name = os.path.dirname(db_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._inflight: dict = {}
+        self._inflight_lock = threading.Lock()
+        with self._lock:
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    prompt_hash TEXT PRIMARY KEY,
+                    response TEXT,
+                    created_at REAL
+                )
+            ''')
+            self.connection.commit()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """バックエンド名・モデル名・プロンプトなどからキャッシュキーを作る。"""
+        payload = json.dumps([str(part) for part in parts], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and self._clock() - created_at > self.ttl_seconds
+
+    def get(self, key: str):
+        """キャッシュされた応答を返す。存在しないか期限切れならNone。"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT response, created_at FROM llm_responses WHERE prompt_hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self._is_expired(row[1]):
+                self.connection.execute("DELETE FROM llm_responses WHERE prompt_hash = ?", (key,))
+                self.connection.commit()
+                return None
+            return row[0]
+
+    def put(self, key: str, response: str):
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO llm_responses (prompt_hash, response, created_at) VALUES (?, ?, ?)",
+                (key, response, self._clock())
+            )
+            self.connection.commit()
+
+    def get_or_compute(self, key: str, compute):
+        """
+        キャッシュを参照し、なければcomputeで生成する。
+
+        Args:
+            key (str): make_keyで作成したキー。
+            compute (callable): (response, error) のタプルを返す生成関数。
+
+        Returns:
+            tuple: (response, error)。_call_local_llmと同じ形式。
+        """
+        cached = self.get(key)
+        if cached is not None:
+            print("--- LLM response served from cache ---")
+            return cached, None
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            print("--- Waiting for an identical in-flight LLM request ---")
+            return future.result()
+
+        try:
+            response, error = compute()
+            if error is None and response is not None:
+                self.put(key, response)
+            future.set_result((response, error))
+            return response, error
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.connection.execute("DELETE FROM llm_responses")
+            self.connection.commit()
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+_shared_caches: dict = {}
+_shared_caches_lock = threading.Lock()
+
+def get_response_cache(db_path: str, ttl_seconds=None) -> LLMResponseCache:
+    """
+    パスごとに共有されるキャッシュを返す。
+    同じキャッシュを使うクライアント同士で、実行中のリクエストが合流できる。
+    """
+    db_path = os.path.abspath(db_path)
+    with _shared_caches_lock:
+        cache = _shared_caches.get(db_path)
+        if cache is None:
+            cache = LLMResponseCache(db_path, ttl_seconds=ttl_seconds)
+            _shared_caches[db_path] = cache
+        return cache
+
+def response_cache_from_config(config, project_root: str):
+    """
+    プロファイルの"response_cache"セクションからキャッシュを構築する。
+    無効化されている場合はNoneを返す。
+
+    例: {"enabled": true, "path": "data/llm_response_cache.sqlite", "ttl_seconds": 604800}
+    """
+    cache_config = (config or {}).get("response_cache") or {}
+    if not cache_config.get("enabled", False):
+        return None
+    db_path = cache_config.get("path", "data/llm_response_cache.sqlite")
+    if not os.path.isabs(db_path):
+        db_path = os.path.join(project_root, db_path)
+    return get_response_cache(db_path, ttl_seconds=cache_config.get("ttl_seconds"))
+
+def load_response_cache(profile_path: str):
+    """
+    プロファイルJSON（例: config/vetra_llm_core_profile.json）を読み込み、
+    その"response_cache"セクションに従ってキャッシュを構築する。
+    相対パスはプロファイルが置かれたconfigディレクトリの親を基準とする。
+    """
+    config = {}
+    if os.path.exists(profile_path):
+        try:
+            with open(profile_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except json.JSONDecodeError:
+            print(f"Warning: Could not decode JSON from {profile_path}. Response cache disabled.")
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(profile_path)))
+    return response_cache_from_config(config, project_root)
@@ -0,0 +1,40 @@
+import hashlib
+
+class _StubResponse:
+    """google.generativeaiの応答と同じく、.text属性を持つ応答オブジェクト。"""
+    def __init__(self, text: str):
+        self.text = text
+
+
+class StubLLMBackend:
+    """
+    オフラインでLLM経路全体をテストするための決定的なスタブバックエンド。
+
+    ollama.chat と同じ形式の chat() と、Geminiモデルと同じ形式の generate_content() を持つ。
+    responses に登録された部分文字列がプロンプトに含まれていればその応答を返し、
+    なければプロンプトのハッシュから決まる固定の文字列を返す。
+    """
+    def __init__(self, responses=None, default_response=None):
+        self.responses = responses if responses is not None else {}
+        self.default_response = default_response
+        self.calls = 0
+
+    def _respond(self, model: str, prompt_text: str) -> str:
+        self.calls += 1
+        for trigger, response in self.responses.items():
+            if trigger in prompt_text:
+                return response
+        if self.default_response is not None:
+            return self.default_response
+        digest = hashlib.sha256(f"{model}\n{prompt_text}".encode('utf-8')).hexdigest()[:12]
+        return f"[stub:{model}] {digest}"
+
+    def chat(self, model, messages):
+        prompt_text = "\n".join(message.get('content', '') for message in messages)
+        return {'message': {'content': self._respond(model, prompt_text)}}
+
+    def generate_content(self, prompt, model="stub"):
+        parts = prompt if isinstance(prompt, list) else [prompt]
+        # 画像などの非テキスト要素は型名だけをプロンプトに含める
+        prompt_text = "\n".join(part if isinstance(part, str) else type(part).__name__ for part in parts)
+        return _StubResponse(self._respond(model, prompt_text))
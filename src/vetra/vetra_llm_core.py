@@ -1,8 +1,10 @@
+import os
 import yaml
 import json
 import ollama
 import transformers
 import torch
+from .stub_llm_backend import StubLLMBackend
 
 class VetraLLMCore:
     """
@@ -15,15 +17,36 @@ class VetraLLMCore:
     def __init__(self, config_path="vector_dimensions_mobile.yaml", 
                  narrative_model="lucas2024/gemma-2-2b-jpn-it:q8_0", 
                  code_gen_model="codegemma:latest",
-                 hf_fallback_model_name=None, hf_fallback_model_path=None):
+                 hf_fallback_model_name=None, hf_fallback_model_path=None,
+                 backend=None, response_cache=None):
         """
         Initializes Vetra's core.
+
+        Args:
+            backend: "ollama" (default), "stub", or an object exposing an ollama-style
+                `chat(model, messages)` method. Defaults to the SIGMASENSE_LLM_BACKEND
+                environment variable so the whole path can run offline.
+            response_cache (LLMResponseCache, optional): Persistent prompt-hash cache.
+                Identical prompts are served from it and concurrent identical
+                requests are coalesced into one generation.
         """
         print("VetraLLMCore initializing...")
         self.narrative_model = narrative_model
         self.code_gen_model = code_gen_model
         self.hf_fallback_model_name = hf_fallback_model_name
         self.hf_fallback_model_path = hf_fallback_model_path
+        self.response_cache = response_cache
+
+        backend = backend or os.getenv("SIGMASENSE_LLM_BACKEND", "ollama")
+        if backend == "ollama":
+            self.backend_name = "ollama"
+            self.chat_backend = None
+        elif backend == "stub":
+            self.backend_name = "stub"
+            self.chat_backend = StubLLMBackend()
+        else:
+            self.backend_name = type(backend).__name__
+            self.chat_backend = backend
 
         self.hf_tokenizer = None
         self.hf_model = None
@@ -59,18 +82,32 @@ class VetraLLMCore:
     def _call_local_llm(self, model, system_prompt, user_prompt):
         """
         Calls the specified local LLM. Tries Ollama first, then falls back to Hugging Face if available.
+        Responses are served from the response cache when one is configured.
+        Returns a tuple (response_content, error_message).
+        """
+        if self.response_cache is None:
+            return self._generate(model, system_prompt, user_prompt)
+        key = self.response_cache.make_key(self.backend_name, model, system_prompt, user_prompt)
+        return self.response_cache.get_or_compute(key, lambda: self._generate(model, system_prompt, user_prompt))
+
+    def _generate(self, model, system_prompt, user_prompt):
+        """
+        Generates a response without consulting the cache.
         Returns a tuple (response_content, error_message).
         """
+        messages = [
+            {'role': 'system', 'content': system_prompt},
+            {'role': 'user', 'content': user_prompt},
+        ]
+        if self.chat_backend is not None:
+            print(f"\n--- Calling Local LLM '{model}' via {self.backend_name} backend (Vetra) ---")
+            response = self.chat_backend.chat(model=model, messages=messages)
+            return response['message']['content'], None
+
         # Try Ollama first
         try:
             print(f"\n--- Calling Local LLM '{model}' via Ollama (Vetra) ---")
-            response = ollama.chat(
-                model=model,
-                messages=[
-                    {'role': 'system', 'content': system_prompt},
-                    {'role': 'user', 'content': user_prompt},
-                ],
-            )
+            response = ollama.chat(model=model, messages=messages)
             print("--- Ollama LLM Response Received ---")
             return response['message']['content'], None
         except Exception as e:
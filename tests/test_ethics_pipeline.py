@@ -0,0 +1,116 @@
+# test_ethics_pipeline.py
+
+import unittest
+import threading
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.sigmasense.ethics_pipeline import EthicsPipeline, EthicsCheck, MemorySnapshot, GATE, TRANSFORM, OBSERVER
+
+def make_gate(name, passed=True, calls=None):
+    def run(narratives, experience, context):
+        if calls is not None:
+            calls.append(name)
+        return {"passed": passed, "log": f"{name}: {'Passed' if passed else 'Blocked'}", "narratives": narratives}
+    return EthicsCheck(name, run, kind=GATE)
+
+def make_transform(name, suffix):
+    def run(narratives, experience, context):
+        narratives["intent_narrative"] += suffix
+        return {"passed": True, "log": f"{name}: Adjusted", "narratives": narratives}
+    return EthicsCheck(name, run, kind=TRANSFORM)
+
+def make_observer(name, seen, cost=1.0):
+    def run(narratives, experience, context):
+        seen[name] = (narratives["intent_narrative"], threading.current_thread().name)
+        return {"passed": True, "log": f"{name}: Observed", "narratives": narratives}
+    return EthicsCheck(name, run, kind=OBSERVER, cost=cost)
+
+class TestEthicsPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.narratives = {"intent_narrative": "語り", "growth_narrative": "成長"}
+
+    def test_log_follows_declaration_order(self):
+        """並列実行やコスト順の並べ替えをしても、ログが宣言順に並ぶことを確認"""
+        seen = {}
+        checks = [
+            make_gate("gate"),
+            make_transform("first", "+1"),
+            make_observer("heavy", seen, cost=10),
+            make_observer("light", seen, cost=1),
+            make_transform("last", "+2"),
+        ]
+        pipeline = EthicsPipeline(checks)
+        result = pipeline.run(self.narratives, {}, mode="fast")
+        pipeline.close()
+
+        self.assertTrue(result["passed"])
+        self.assertEqual([entry.split(":")[0] for entry in result["log"]], ["gate", "first", "heavy", "light", "last"])
+        self.assertEqual(set(result["timings"]), {"gate", "first", "heavy", "light", "last"})
+        self.assertEqual(result["narratives"]["intent_narrative"], "語り+1+2")
+
+    def test_observers_see_preceding_transforms(self):
+        """独立した検査が直前の調整結果を参照し、ワーカースレッドで実行されることを確認"""
+        seen = {}
+        checks = [make_transform("first", "+1"), make_observer("a", seen), make_observer("b", seen), make_transform("last", "+2")]
+        pipeline = EthicsPipeline(checks)
+        pipeline.run(self.narratives, {}, mode="fast")
+        pipeline.close()
+
+        self.assertEqual(seen["a"][0], "語り+1")
+        self.assertEqual(seen["b"][0], "語り+1")
+        self.assertTrue(all(thread.startswith("ethics") for _, thread in seen.values()))
+
+    def test_fast_mode_exits_early(self):
+        """fastモードでは重大な違反で以降の誓いを打ち切ることを確認"""
+        calls = []
+        checks = [make_gate("orien", passed=False, calls=calls), make_gate("aegis", calls=calls), make_transform("vetra", "+1")]
+        result = EthicsPipeline(checks).run(self.narratives, {}, mode="fast")
+
+        self.assertFalse(result["passed"])
+        self.assertEqual(calls, ["orien"])
+        self.assertEqual(list(result["timings"]), ["orien"])
+
+    def test_exhaustive_mode_runs_every_check(self):
+        """exhaustiveモードでは違反後もすべての誓いを実行することを確認"""
+        calls = []
+        checks = [make_gate("orien", passed=False, calls=calls), make_gate("aegis", calls=calls), make_transform("vetra", "+1")]
+        result = EthicsPipeline(checks).run(self.narratives, {}, mode="exhaustive")
+
+        self.assertFalse(result["passed"])
+        self.assertEqual(calls, ["orien", "aegis"])
+        self.assertEqual(len(result["log"]), 3)
+
+    def test_cheap_gates_run_first(self):
+        """連続するgateはコストのヒントに従って安いものから評価されることを確認"""
+        calls = []
+        checks = [make_gate("expensive", passed=False, calls=calls), make_gate("cheap", passed=False, calls=calls)]
+        pipeline = EthicsPipeline(checks, config={"cost_hints": {"expensive": 5, "cheap": 1}})
+        result = pipeline.run(self.narratives, {}, mode="fast")
+
+        self.assertEqual(calls, ["cheap"])
+        self.assertEqual(result["log"], ["cheap: Blocked"])
+
+    def test_unknown_mode_is_rejected(self):
+        """未定義のモードはエラーとなることを確認"""
+        with self.assertRaises(ValueError):
+            EthicsPipeline([]).run(self.narratives, {}, mode="turbo")
+
+    def test_memory_snapshot_reads_once(self):
+        """記憶のスナップショットが全件読み出しを一度にまとめることを確認"""
+        class CountingGraph:
+            def __init__(self):
+                self.calls = 0
+            def get_all_memories(self):
+                self.calls += 1
+                return [{"id": "m1"}]
+
+        graph = CountingGraph()
+        snapshot = MemorySnapshot(graph)
+        snapshot.get_all_memories()
+        self.assertEqual(snapshot.get_all_memories(), [{"id": "m1"}])
+        self.assertEqual(graph.calls, 1)
+
+if __name__ == '__main__':
+    unittest.main()
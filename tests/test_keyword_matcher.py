@@ -0,0 +1,59 @@
+# test_keyword_matcher.py
+
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.aegis.keyword_matcher import KeywordMatcher, get_keyword_matcher, normalize_with_offsets
+
+class TestKeywordMatcher(unittest.TestCase):
+
+    def test_overlapping_matches(self):
+        """接頭辞・接尾辞を共有するキーワードがすべて検出されることを確認"""
+        matcher = KeywordMatcher(["he", "she", "his", "hers"])
+        matches = matcher.find_all("ushers")
+        self.assertEqual(matches, [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")])
+
+    def test_matches_agree_with_substring_search(self):
+        """単純な部分文字列検索と同じ語を検出することを確認"""
+        words = ['馬鹿', '死ね', '殺す', '阿呆', '馬']
+        text = "馬鹿と阿呆が馬に乗って死ねと言った"
+        matcher = KeywordMatcher(words)
+        found = {keyword for _, _, keyword in matcher.find_all(text)}
+        self.assertEqual(found, {word for word in words if word in text})
+
+    def test_spans_refer_to_original_text(self):
+        """全角英字・半角カナを正規化しつつ、元テキスト上の位置を返すことを確認"""
+        matcher = KeywordMatcher(["ProjectX", "ガス"])
+        text = "これはＰＲＯＪＥＣＴｘとｶﾞｽの話"
+        matches = matcher.find_all(text)
+        self.assertEqual([text[start:end] for start, end, _ in matches], ["ＰＲＯＪＥＣＴｘ", "ｶﾞｽ"])
+        self.assertEqual([keyword for _, _, keyword in matches], ["ProjectX", "ガス"])
+
+    def test_normalization_offsets(self):
+        """正規化後の各文字が元テキストの範囲に対応付けられることを確認"""
+        normalized, offsets = normalize_with_offsets("Aｶﾞ")
+        self.assertEqual(normalized, "aガ")
+        self.assertEqual(offsets, [(0, 1), (1, 3)])
+
+    def test_redact_merges_overlaps(self):
+        """重なり合う一致が一つの伏字範囲にまとめられることを確認"""
+        matcher = KeywordMatcher(["abc", "bcd"])
+        redacted, found = matcher.redact("xabcdx")
+        self.assertEqual(redacted, "x■■■■x")
+        self.assertEqual(found, ["abc", "bcd"])
+
+    def test_find_first_keyword_uses_list_order(self):
+        """複数の一致がある場合、リストで先に定義されたキーワードを返すことを確認"""
+        matcher = KeywordMatcher(["秘密", "ProjectX"])
+        self.assertEqual(matcher.find_first_keyword("ProjectXの秘密"), "秘密")
+        self.assertIsNone(matcher.find_first_keyword("公開情報"))
+
+    def test_matcher_is_rebuilt_only_when_list_changes(self):
+        """同じキーワードリストではコンパイル済みのマッチャーが再利用されることを確認"""
+        first = get_keyword_matcher(['馬鹿', '阿呆'])
+        self.assertIs(first, get_keyword_matcher(['馬鹿', '阿呆']))
+        self.assertIsNot(first, get_keyword_matcher(['馬鹿', '阿呆', '死ね']))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import json
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.vetra.llm_response_cache import LLMResponseCache
+from src.vetra.stub_llm_backend import StubLLMBackend
+from src.vetra.vetra_llm_core import VetraLLMCore
+
+class TestLLMResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "llm_cache.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_response_persists_across_instances(self):
+        """保存した応答が別のインスタンスからも読み出せることを確認"""
+        cache = LLMResponseCache(self.db_path)
+        key = cache.make_key("ollama", "model", "system", "user")
+        cache.put(key, "応答")
+        cache.close()
+
+        reopened = LLMResponseCache(self.db_path)
+        self.assertEqual(reopened.get(key), "応答")
+        reopened.close()
+
+    def test_expired_response_is_regenerated(self):
+        """TTLを過ぎた応答は破棄され、再生成されることを確認"""
+        now = [1000.0]
+        cache = LLMResponseCache(self.db_path, ttl_seconds=60, clock=lambda: now[0])
+        key = cache.make_key("prompt")
+        cache.put(key, "old")
+        now[0] += 61
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.get_or_compute(key, lambda: ("new", None)), ("new", None))
+        cache.close()
+
+    def test_errors_are_not_cached(self):
+        """生成に失敗した応答はキャッシュされないことを確認"""
+        cache = LLMResponseCache(self.db_path)
+        key = cache.make_key("prompt")
+        cache.get_or_compute(key, lambda: (None, "connection refused"))
+        self.assertIsNone(cache.get(key))
+        cache.close()
+
+    def test_identical_inflight_requests_are_coalesced(self):
+        """同じプロンプトの同時リクエストが一回の生成にまとめられることを確認"""
+        cache = LLMResponseCache(self.db_path)
+        key = cache.make_key("prompt")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_compute():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "shared", None
+
+        results = []
+        owner = threading.Thread(target=lambda: results.append(cache.get_or_compute(key, slow_compute)))
+        owner.start()
+        started.wait(timeout=5)
+        waiter = threading.Thread(target=lambda: results.append(cache.get_or_compute(key, slow_compute)))
+        waiter.start()
+        release.set()
+        owner.join()
+        waiter.join()
+        cache.close()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [("shared", None), ("shared", None)])
+
+class TestVetraLLMCoreWithStubBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = LLMResponseCache(os.path.join(self.temp_dir, "llm_cache.sqlite"))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_stub_backend_is_deterministic(self):
+        """スタブバックエンドが同じプロンプトに同じ応答を返すことを確認"""
+        stub = StubLLMBackend()
+        first = stub.chat(model="m", messages=[{"role": "user", "content": "hello"}])
+        second = stub.chat(model="m", messages=[{"role": "user", "content": "hello"}])
+        self.assertEqual(first, second)
+        self.assertTrue(first['message']['content'].startswith("[stub:m]"))
+
+    def test_repeated_dimension_proposal_uses_cache(self):
+        """同じ未知パターンに対する次元提案が、二回目はキャッシュから返されることを確認"""
+        proposal = {"id": "stub_dimension", "name_ja": "スタブ次元", "description": "d", "algorithm_idea": "a"}
+        stub = StubLLMBackend(responses={"propose a new semantic dimension": f"```json\n{json.dumps(proposal)}\n```"})
+        vetra = VetraLLMCore(config_path=os.path.join(self.temp_dir, "missing.yaml"), backend=stub, response_cache=self.cache)
+
+        features = {"edge_density": 0.01}
+        self.assertEqual(vetra.propose_new_dimension(features), proposal)
+        self.assertEqual(vetra.propose_new_dimension(features), proposal)
+        self.assertEqual(stub.calls, 1)
+
+if __name__ == '__main__':
+    unittest.main()